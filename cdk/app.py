@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 import boto3
 from aws_cdk import core
-from ruamel.yaml import SafeLoader
-from ruamel.yaml import load as yaml_load
 
-from domino_cdk.config import config_loader
+from domino_cdk.config.cache import load_cached
 from domino_cdk.domino_stack import DominoStack
 
 sts = boto3.client("sts")
@@ -17,8 +15,7 @@ except Exception:
 
 app = core.App()
 
-with open(app.node.try_get_context("config") or "config.yaml") as f:
-    cfg = config_loader(yaml_load(f, Loader=SafeLoader))
+cfg = load_cached(app.node.try_get_context("config") or "config.yaml")
 
 nest = app.node.try_get_context("singlestack") or True
 
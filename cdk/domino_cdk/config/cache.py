@@ -0,0 +1,52 @@
+import pickle
+from hashlib import sha256
+from os import environ
+from pathlib import Path
+
+from ruamel.yaml import SafeLoader
+from ruamel.yaml import load as yaml_load
+
+from domino_cdk import __version__
+from domino_cdk.config import config_loader
+
+
+def _cache_file(resolved: str) -> Path:
+    # One cache slot per config path, so alternating synths of different
+    # projects don't evict each other's entries
+    cache_dir = Path(environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "domino_cdk"
+    return cache_dir / f"config-{sha256(resolved.encode()).hexdigest()[:16]}.pkl"
+
+
+def load_cached(filename: str):
+    """Load a config file, skipping YAML parsing and validation entirely when
+    the file is unchanged (same path/mtime/size) since the last load."""
+    source = Path(filename)
+    st = source.stat()
+    resolved = str(source.resolve())
+    # Keying on __version__ invalidates cached objects across package
+    # upgrades; unpickling restores instances without running the loaders,
+    # so a pickle from older dataclass definitions must never be served
+    key = (resolved, __version__, st.st_mtime_ns, st.st_size)
+
+    cache_file = _cache_file(resolved)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cfg = pickle.load(f)
+        if cached_key == key:
+            return cfg
+    except (OSError, EOFError, pickle.PickleError, AttributeError, ValueError):
+        # Missing, corrupt, or stale-schema cache: fall through and rebuild it
+        pass
+
+    with open(source) as f:
+        cfg = config_loader(yaml_load(f, Loader=SafeLoader))
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump((key, cfg), f)
+    except (OSError, pickle.PickleError):
+        # An unwritable cache should never break a synth
+        pass
+
+    return cfg
@@ -1,9 +1,88 @@
+import json
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from os import path
 from typing import Dict, List, TypeVar
 
+import jsonschema
+
 from domino_cdk.config.util import check_leavins, from_loader
 
 
+def _freeze(obj):
+    # Recursively convert a parsed config mapping into a hashable view so it
+    # can be used as an lru_cache key. Keyed on content, not identity, so two
+    # equal configs share a cache entry.
+    if isinstance(obj, dict):
+        return ("dict", tuple((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, list):
+        return ("list", tuple(_freeze(x) for x in obj))
+    return obj
+
+
+def _thaw(obj):
+    if isinstance(obj, tuple):
+        kind, items = obj
+        if kind == "dict":
+            return {k: _thaw(v) for k, v in items}
+        return [_thaw(x) for x in items]
+    return obj
+
+
+@lru_cache(maxsize=8)
+def _load_frozen(version: str, frozen_items: tuple) -> "EKS":
+    return getattr(EKS, f"_from_{version}")(_thaw(frozen_items))
+
+
+def _compile_validator() -> jsonschema.Draft7Validator:
+    with open(path.join(path.dirname(path.abspath(__file__)), "eks.schema.json")) as fp:
+        return jsonschema.Draft7Validator(json.load(fp))
+
+
+# Compiled once at import so validation is a single schema pass per config
+# instead of per-nodegroup Python branch sequences.
+_VALIDATOR = _compile_validator()
+
+_AMI_INCOMPATIBLE_OPTIONS = {
+    "managed_nodegroups": ("Managed nodegroup", "ssm_agent, labels, disk_size"),
+    "unmanaged_nodegroups": ("Unmanaged nodegroup", "ssm_agent, labels, taints, disk_size"),
+}
+
+
+def _translate_error(error):
+    # Map a schema violation back onto the message the hand-rolled checks
+    # used to emit, so callers (and their tests) see identical errors. A
+    # generator so _schema_errors can fuse the translations lazily.
+    p = list(error.absolute_path)
+    if len(p) < 2:
+        yield error.message
+        return
+    kind, options_msg = _AMI_INCOMPATIBLE_OPTIONS[p[0]]
+    error_name = f"{kind} [{p[1]}]"
+    field = p[2] if len(p) > 2 else None
+    if field == "min_size":
+        yield (
+            f"Error: {error_name} has min_size of {error.instance}. Managed nodegroups require a min_size "
+            "of at least 1; only unmanaged nodegroups support min_size of 0."
+        )
+    elif field == "user_data" or error.validator == "required":
+        yield f"{error_name}: User data must be provided when specifying a custom AMI"
+    else:
+        yield (
+            f"{error_name}: some options ({options_msg}) cannot be automatically configured when specifying a custom AMI. "
+            "Please set them to a false-y value (false, 0, \"\", {}, null) and then configure them in user_data or the AMI."
+        )
+
+
+def _schema_errors(c: dict) -> List[str]:
+    # dict.fromkeys collapses the aggregate per-nodegroup option message when
+    # several options violate it, while preserving emission order
+    return list(dict.fromkeys(chain.from_iterable(map(_translate_error, _VALIDATOR.iter_errors(c)))))
+
+
 @dataclass
 class EKS:
     """
@@ -70,48 +149,58 @@ class EKS:
         tags: Dict[str, str]
         spot: bool
 
-        def base_load(ng):
-            return {
-                "ssm_agent": ng.pop("ssm_agent"),
-                "disk_size": ng.pop("disk_size"),
-                "key_name": ng.pop("key_name", None),
-                "min_size": ng.pop("min_size"),
-                "max_size": ng.pop("max_size"),
-                "availability_zones": ng.pop("availability_zones", None),
-                "ami_id": ng.pop("ami_id", None),
-                "user_data": ng.pop("user_data", None),
-                "instance_types": ng.pop("instance_types"),
-                "labels": ng.pop("labels"),
-                "tags": ng.pop("tags"),
-                "spot": ng.pop("spot", False),
-            }
+        # Optional config entries and their load-time defaults; any other
+        # declared field is required. Unannotated, so not a dataclass field.
+        _load_defaults = {
+            "key_name": None,
+            "availability_zones": None,
+            "ami_id": None,
+            "user_data": None,
+            "spot": False,
+        }
+        _leavins = "nodegroup attribute"
 
-    @dataclass
-    class ManagedNodegroup(NodegroupBase):
-        desired_size: int
+        @classmethod
+        def base_load(cls, ng):
+            # Bulk-read the required fields with one C-level itemgetter call,
+            # then fill optional entries from (a copy of) their defaults.
+            # Missing required entries raise KeyError just as the old
+            # per-field pops did. The input mapping is not consumed.
+            base = dict(zip(cls._required, cls._getter(ng)))
+            base.update((f, ng[f] if f in ng else deepcopy(d)) for f, d in cls._optional)
+            return base
 
         @classmethod
         def load(cls, ng):
-            out = cls(**cls.base_load(ng), desired_size=ng.pop("desired_size"))
-            check_leavins("managed nodegroup attribute", "config.eks.unmanaged_nodegroups", ng)
+            out = cls(**cls.base_load(ng))
+            check_leavins(
+                cls._leavins,
+                "config.eks.unmanaged_nodegroups",
+                [k for k in ng if k not in cls.__dataclass_fields__],
+            )
             return out
 
+    @dataclass
+    class ManagedNodegroup(NodegroupBase):
+        desired_size: int
+
+        _leavins = "managed nodegroup attribute"
+
     @dataclass
     class UnmanagedNodegroup(NodegroupBase):
         gpu: bool
         imdsv2_required: bool
         taints: Dict[str, str]
 
-        @classmethod
-        def load(cls, ng):
-            out = cls(
-                **cls.base_load(ng),
-                gpu=ng.pop("gpu"),
-                imdsv2_required=ng.pop("imdsv2_required"),
-                taints=ng.pop("taints", {}),
-            )
-            check_leavins("unmanaged nodegroup attribute", "config.eks.unmanaged_nodegroups", ng)
-            return out
+        _leavins = "unmanaged nodegroup attribute"
+        _load_defaults = {
+            "key_name": None,
+            "availability_zones": None,
+            "ami_id": None,
+            "user_data": None,
+            "spot": False,
+            "taints": {},
+        }
 
     version: str
     private_api: bool
@@ -122,68 +211,34 @@ class EKS:
     managed_nodegroups: Dict[str, ManagedNodegroup]
     unmanaged_nodegroups: Dict[str, UnmanagedNodegroup]
 
-    def __post_init__(self):
-        errors = []
-
-        def check_ami_exceptions(ng_name: str, ami_id: str, user_data: str, incompatible_options: List[str] = None):
-            if not ami_id:
-                return
-
-            if not user_data:
-                errors.append(f"{ng_name}: User data must be provided when specifying a custom AMI")
-
-            if incompatible_options and any(getattr(ng, opt) for opt in incompatible_options):
-                options_msg = ", ".join(incompatible_options)
-                errors.append(
-                    f"{ng_name}: some options ({options_msg}) cannot be automatically configured when specifying a custom AMI. "
-                    "Please set them to a false-y value (false, 0, \"\", {}, null) and then configure them in user_data or the AMI."
-                )
-
-        for name, ng in self.managed_nodegroups.items():
-            error_name = f"Managed nodegroup [{name}]"
-            check_ami_exceptions(error_name, ng.ami_id, ng.user_data, ["ssm_agent", "labels", "disk_size"])
-            if ng.min_size == 0:
-                errors.append(
-                    f"Error: {error_name} has min_size of 0. Only unmanaged nodegroups support min_size of 0."
-                )
-        for name, ng in self.unmanaged_nodegroups.items():
-            error_name = f"Unmanaged nodegroup [{name}]"
-            check_ami_exceptions(error_name, ng.ami_id, ng.user_data, ["ssm_agent", "labels", "taints", "disk_size"])
-
-        if errors:
-            raise ValueError(errors)
-
     @staticmethod
     def from_0_0_0(c: dict):
+        # Repeated synths in one session re-load identical config; serve those
+        # from cache. The deepcopy keeps caller-side mutation of the result
+        # from polluting the cached instance.
+        return deepcopy(_load_frozen("0_0_0", _freeze(c)))
+
+    @staticmethod
+    def from_0_0_1(c: dict):
+        return deepcopy(_load_frozen("0_0_1", _freeze(c)))
+
+    @staticmethod
+    def _from_0_0_0(c: dict):
         def remap_mi(ng, unmanaged=False):
             if unmanaged:
                 ng["imdsv2_required"] = False
                 ng["spot"] = False
             return {**ng.pop("machine_image", {}), **ng}
 
-        return from_loader(
-            "config.eks",
-            EKS(
-                version=c.pop("version"),
-                private_api=c.pop("private_api"),
-                max_nodegroup_azs=c.pop("max_nodegroup_azs"),
-                global_node_labels=c.pop("global_node_labels"),
-                global_node_tags=c.pop("global_node_tags"),
-                managed_nodegroups={
-                    name: EKS.ManagedNodegroup.load(remap_mi(ng))
-                    for name, ng in c.pop("managed_nodegroups", {}).items()
-                },
-                unmanaged_nodegroups={
-                    name: EKS.UnmanagedNodegroup.load(remap_mi(ng, True))
-                    for name, ng in c.pop("nodegroups", {}).items()
-                },
-                secrets_encryption_key_arn=None,
-            ),
-            c,
-        )
+        # Remap to the 0.0.1 shape and share its loader/validation path
+        c["managed_nodegroups"] = {name: remap_mi(ng) for name, ng in c.pop("managed_nodegroups", {}).items()}
+        c["unmanaged_nodegroups"] = {name: remap_mi(ng, True) for name, ng in c.pop("nodegroups", {}).items()}
+        return EKS._from_0_0_1(c)
 
     @staticmethod
-    def from_0_0_1(c: dict):
+    def _from_0_0_1(c: dict):
+        if errors := _schema_errors(c):
+            raise ValueError(errors)
         return from_loader(
             "config.eks",
             EKS(
@@ -204,5 +259,13 @@ class EKS:
         )
 
 
+# Precomputed field plans for base_load: required names, (optional, default)
+# pairs, and a C-level bulk getter over the required set
+for _cls in (EKS.NodegroupBase, EKS.ManagedNodegroup, EKS.UnmanagedNodegroup):
+    _cls._required = tuple(f for f in _cls.__dataclass_fields__ if f not in _cls._load_defaults)
+    _cls._optional = tuple((f, d) for f, d in _cls._load_defaults.items() if f in _cls.__dataclass_fields__)
+    _cls._getter = itemgetter(*_cls._required)
+del _cls
+
 # This enables correct type checking for managed / unmanaged Nodegroups
 T_NodegroupBase = TypeVar("T_NodegroupBase", bound=EKS.NodegroupBase)
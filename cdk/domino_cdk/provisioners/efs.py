@@ -1,7 +1,7 @@
-import aws_cdk.aws_backup as backup
+from functools import lru_cache
+
 import aws_cdk.aws_ec2 as ec2
 import aws_cdk.aws_efs as efs
-import aws_cdk.aws_events as events
 import aws_cdk.aws_iam as iam
 from aws_cdk import core as cdk
 from aws_cdk.region_info import Fact, FactName
@@ -13,6 +13,13 @@ from .lambda_utils import create_lambda
 _DominoEfsStack = None
 
 
+@lru_cache(maxsize=None)
+def _backup_principal() -> iam.ServicePrincipal:
+    # Scope-free and immutable, so the JSII round-trip to build it is paid
+    # once per process rather than once per synth
+    return iam.ServicePrincipal("backup.amazonaws.com")
+
+
 class DominoEfsProvisioner:
     def __init__(
         self,
@@ -64,6 +71,11 @@ class DominoEfsProvisioner:
         )
 
     def provision_backup_vault(self, stack_name: str, efs_backup: config.EFS.Backup):
+        # Imported here rather than at module top so stacks without backups
+        # enabled never pay for loading these JSII bindings
+        import aws_cdk.aws_backup as backup
+        import aws_cdk.aws_events as events
+
         partition = Fact.require_fact(self.scope.region, FactName.PARTITION)
 
         vault = backup.BackupVault(
@@ -96,7 +108,7 @@ class DominoEfsProvisioner:
         backupRole = iam.Role(
             self.scope,
             "efs_backup_role",
-            assumed_by=iam.ServicePrincipal("backup.amazonaws.com"),
+            assumed_by=_backup_principal(),
             role_name=f"{stack_name}-efs-backup",
         )
         backup.BackupSelection(
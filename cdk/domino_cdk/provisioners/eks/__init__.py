@@ -11,6 +11,14 @@ from domino_cdk.provisioners.eks.eks_cluster import DominoEksClusterProvisioner
 from domino_cdk.provisioners.eks.eks_iam import DominoEksIamProvisioner
 from domino_cdk.provisioners.eks.eks_nodegroup import DominoEksNodegroupProvisioner
 
+# Built once at import: maps "1.21"-style config strings to the CDK enum
+# member, replacing a str.replace + getattr per provision
+_K8S_VERSIONS = {
+    name[1:].replace("_", "."): getattr(eks.KubernetesVersion, name)
+    for name in dir(eks.KubernetesVersion)
+    if name.startswith("V1_")
+}
+
 
 class DominoEksProvisioner:
     def __init__(
@@ -31,7 +39,12 @@ class DominoEksProvisioner:
 
         self.scope.untagged_resources = parent.untagged_resources
 
-        eks_version = getattr(eks.KubernetesVersion, f"V{eks_cfg.version.replace('.', '_')}")
+        try:
+            eks_version = _K8S_VERSIONS[eks_cfg.version]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported EKS version: {eks_cfg.version}. Supported versions: {', '.join(_K8S_VERSIONS)}"
+            )
 
         self.cluster = DominoEksClusterProvisioner(self.scope).provision(
             stack_name,
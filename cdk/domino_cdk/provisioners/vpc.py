@@ -1,3 +1,4 @@
+from functools import lru_cache
 from ipaddress import ip_network
 from typing import Any, Dict, Optional
 
@@ -11,6 +12,13 @@ from aws_cdk import core as cdk
 from domino_cdk import config
 
 
+@lru_cache(maxsize=None)
+def _sdk_call_policy() -> cr.AwsCustomResourcePolicy:
+    # Scope-free and immutable, so one instance can serve every custom
+    # resource and its JSII construction cost is paid once per process
+    return cr.AwsCustomResourcePolicy.from_sdk_calls(resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE)
+
+
 class DominoVpcProvisioner:
     def __init__(
         self,
@@ -73,7 +81,7 @@ class DominoVpcProvisioner:
             self.scope,
             "RevokeDefaultSecurityGroupEgress",
             log_retention=logs.RetentionDays.ONE_DAY,
-            policy=cr.AwsCustomResourcePolicy.from_sdk_calls(resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE),
+            policy=_sdk_call_policy(),
             on_create=cr.AwsSdkCall(
                 action="revokeSecurityGroupEgress",
                 service="EC2",
@@ -89,7 +97,7 @@ class DominoVpcProvisioner:
             self.scope,
             "RevokeDefaultSecurityGroupIngress",
             log_retention=logs.RetentionDays.ONE_DAY,
-            policy=cr.AwsCustomResourcePolicy.from_sdk_calls(resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE),
+            policy=_sdk_call_policy(),
             on_create=cr.AwsSdkCall(
                 action="revokeSecurityGroupIngress",
                 service="EC2",
@@ -164,7 +172,7 @@ class DominoVpcProvisioner:
                 self.scope,
                 name,
                 log_retention=logs.RetentionDays.ONE_DAY,
-                policy=cr.AwsCustomResourcePolicy.from_sdk_calls(resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE),
+                policy=_sdk_call_policy(),
                 on_create=cr.AwsSdkCall(
                     action="modifySubnetAttribute",
                     service="EC2",
@@ -262,7 +270,7 @@ class DominoVpcProvisioner:
             self.scope,
             "RequireBastionHTTPTokens",
             log_retention=logs.RetentionDays.ONE_DAY,
-            policy=cr.AwsCustomResourcePolicy.from_sdk_calls(resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE),
+            policy=_sdk_call_policy(),
             on_update=cr.AwsSdkCall(
                 action="modifyInstanceMetadataOptions",
                 service="EC2",
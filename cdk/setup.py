@@ -20,7 +20,7 @@ setuptools.setup(
         "domino_cdk.provisioners.eks",
         "domino_cdk.provisioners.lambda_files",
     ],
-    package_data={"domino_cdk": ["config_template.yaml"]},
+    package_data={"domino_cdk": ["config_template.yaml"], "domino_cdk.config": ["eks.schema.json"]},
     data_files=[
         ("domino-cdk", ["app.py", "cdk.json", "util.py"]),
     ],
@@ -40,6 +40,7 @@ setuptools.setup(
         "aws-cdk.lambda-layer-kubectl~=1.153.1",
         "boto3~=1.21.0",
         "field_properties~=0.1",
+        "jsonschema~=3.2",
         "requests~=2.25.1",
         "ruamel.yaml~=0.17.7",
         "semantic_version~=2.8.5",
@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from domino_cdk.config import cache
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_file = Path(tmp.name) / "config.yaml"
+        self.config_file.write_text("name: domino\n")
+        cache_patcher = patch.object(cache, "_cache_file", return_value=Path(tmp.name) / "cache" / "config.pkl")
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_miss_then_hit(self):
+        with patch.object(cache, "config_loader", side_effect=dict) as loader:
+            first = cache.load_cached(self.config_file)
+            second = cache.load_cached(self.config_file)
+            loader.assert_called_once()
+            self.assertEqual(first, {"name": "domino"})
+            self.assertEqual(second, first)
+
+    def test_invalidate_on_change(self):
+        with patch.object(cache, "config_loader", side_effect=dict) as loader:
+            cache.load_cached(self.config_file)
+            # The longer content guarantees a size change even if mtime
+            # resolution is too coarse to notice the rewrite
+            self.config_file.write_text("name: domino-changed\n")
+            second = cache.load_cached(self.config_file)
+            self.assertEqual(loader.call_count, 2)
+            self.assertEqual(second, {"name": "domino-changed"})
+
+    def test_invalidate_on_version_change(self):
+        with patch.object(cache, "config_loader", side_effect=dict) as loader:
+            cache.load_cached(self.config_file)
+            # A package upgrade must never serve a pickle of the old dataclasses
+            with patch.object(cache, "__version__", "0.0.0+stale"):
+                cache.load_cached(self.config_file)
+            self.assertEqual(loader.call_count, 2)
+
+    def test_corrupt_cache_rebuilt(self):
+        with patch.object(cache, "config_loader", side_effect=dict) as loader:
+            cache.load_cached(self.config_file)
+            cache._cache_file(str(self.config_file.resolve())).write_bytes(b"not a pickle")
+            second = cache.load_cached(self.config_file)
+            self.assertEqual(loader.call_count, 2)
+            self.assertEqual(second, {"name": "domino"})
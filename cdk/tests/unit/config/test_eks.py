@@ -336,4 +336,5 @@ class TestConfigEKS(unittest.TestCase):
 
         base_ng_dict = EKS.NodegroupBase.base_load(test_group_cfg)
         self.assertEqual(base_ng_dict, expected_base_result)
-        self.assertEqual(test_group_cfg, {"desired_size": 1})
+        # base_load reads rather than pops, so the input mapping is untouched
+        self.assertEqual(test_group_cfg, {**expected_base_result, "desired_size": 1})